@@ -32,6 +32,7 @@ setup(
     extras_require={
         "google": ["langchain-google-genai>=2.0.0"],
         "groq": ["langchain-groq>=0.2.0"],
+        "fast": ["orjson>=3.9.0", "uvloop>=0.18.0; sys_platform != 'win32'"],
         "dev": ["pytest>=8.0.0", "pytest-asyncio>=0.23.0"],
     },
 )
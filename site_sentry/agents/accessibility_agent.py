@@ -6,7 +6,7 @@ Handles: ARIA, semantic HTML, keyboard nav, alt text, heading hierarchy, contras
 from __future__ import annotations
 from typing import Any, Dict, List
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import SystemMessage
 
 from site_sentry.core.base_agent import BaseAgent
 from site_sentry.config.schema import SentryConfig
@@ -69,6 +69,8 @@ OUTPUT FORMAT — JSON only, no markdown fences, no preamble:
 Use "changes": [] if no safe accessibility fixes can be applied.
 """
 
+_SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
+
 
 class AccessibilityAgent(BaseAgent):
     """Fixes Lighthouse accessibility audit failures (WCAG 2.2 AA focus)."""
@@ -91,23 +93,15 @@ class AccessibilityAgent(BaseAgent):
                 )
 
             prompt = self._build_prompt(url, issues, file_contents)
-            raw = await self._invoke_llm(
-                [
-                    SystemMessage(content=SYSTEM_PROMPT),
-                    HumanMessage(content=prompt),
-                ]
-            )
-
-            result = self._extract_json(raw)
-            changes = self._normalize_change_list(result.get("changes"))
-            summary = str(result.get("summary", ""))
+            result = await self._request_changes(_SYSTEM_MESSAGE, prompt)
+            changes = result["changes"]
 
             self.memory.store(
                 {"url": url, "issues_fixed": len(changes)},
                 doc_type="accessibility_fix",
             )
             self.logger.info("Accessibility fixes generated", changes=len(changes))
-            return self._success_result(changes=changes, summary=summary)
+            return result
 
         except Exception as e:
             return self._error_result(e, "AccessibilityAgent.process")
@@ -3,7 +3,7 @@
 from __future__ import annotations
 from typing import Any, Dict
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import SystemMessage
 
 from site_sentry.config.schema import SentryConfig
 from site_sentry.core.base_agent import BaseAgent
@@ -60,6 +60,8 @@ OUTPUT FORMAT — JSON only, no markdown fences, no preamble:
 Use "changes": [] if no content is demonstrably outdated or broken.
 """
 
+_SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
+
 
 class ContentUpdateAgent(BaseAgent):
     llm_role = "agent"
@@ -76,17 +78,6 @@ class ContentUpdateAgent(BaseAgent):
             "Suggest minimal safe content updates as JSON changes."
         )
         try:
-            raw = await self._invoke_llm(
-                [
-                    SystemMessage(content=SYSTEM_PROMPT),
-                    HumanMessage(content=prompt),
-                ]
-            )
-            result = self._extract_json(raw)
-            changes = self._normalize_change_list(result.get("changes"))
-            return self._success_result(
-                changes=changes,
-                summary=str(result.get("summary", "")),
-            )
+            return await self._request_changes(_SYSTEM_MESSAGE, prompt)
         except Exception as e:
             return self._error_result(e, "ContentUpdateAgent.process")
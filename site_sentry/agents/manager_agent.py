@@ -11,6 +11,7 @@ import structlog
 from langgraph.graph import StateGraph, START, END
 
 from site_sentry.config.schema import SentryConfig
+from site_sentry.core.base_agent import cleanup_agents
 from site_sentry.core.memory import AgentMemory
 from site_sentry.agents.seo_agent import SEOAgent
 from site_sentry.agents.performance_agent import PerformanceAgent
@@ -129,25 +130,36 @@ class ManagerAgent:
         ],
     }
 
+    # Agent name (matches config.agents toggles) → specialized agent class
+    AGENT_CLASSES = {
+        "seo": SEOAgent,
+        "performance": PerformanceAgent,
+        "error_fixing": ErrorFixingAgent,
+        "accessibility": AccessibilityAgent,
+        "content_update": ContentUpdateAgent,
+        "content_generation": ContentGenerationAgent,
+    }
+
+    # Upper bound on simultaneous GitHub file reads in fetch_files — one per
+    # pooled connection, so worker threads never wait on the session's pool
+    MAX_CONCURRENT_FETCHES = GitHubController.MAX_CONNECTIONS
+
+    # Seconds between consecutive specialized-agent starts (40 RPM safety margin)
+    AGENT_START_INTERVAL = 1.5
+
     def __init__(self, config: SentryConfig, github: Optional[GitHubController] = None):
         self.config = config
         self.github = github
         self.logger = logger.bind(agent="manager_agent")
-        self.memory = AgentMemory(
-            agent_name="manager_agent",
-            db_path=config.memory.vector_store_path,
-            enabled=config.memory.enabled,
-            collection_prefix=config.memory.collection_prefix,
-        )
+        self.memory = AgentMemory.from_config("manager_agent", config)
 
-        # Initialize all specialized agents
+        # Initialize only the specialized agents enabled in config — each one
+        # builds its own LLM client and memory collection, and _plan never
+        # schedules a disabled agent anyway
         self.agents = {
-            "seo": SEOAgent(config),
-            "performance": PerformanceAgent(config),
-            "error_fixing": ErrorFixingAgent(config),
-            "accessibility": AccessibilityAgent(config),
-            "content_update": ContentUpdateAgent(config),
-            "content_generation": ContentGenerationAgent(config),
+            name: agent_cls(config)
+            for name, agent_cls in self.AGENT_CLASSES.items()
+            if getattr(config.agents, name, False)
         }
 
         # Build the LangGraph workflow
@@ -181,7 +193,6 @@ class ManagerAgent:
     async def _plan(self, state: PipelineState) -> Dict[str, Any]:
         """Decide which agents to run based on scores and config toggles."""
         tasks = state.get("tasks", [])
-        agent_config = self.config.agents
 
         active: List[str] = []
         for task in tasks:
@@ -190,17 +201,8 @@ class ManagerAgent:
             if not agent_name:
                 continue
 
-            # Check if agent is enabled in config
-            enabled_map = {
-                "seo": agent_config.seo,
-                "performance": agent_config.performance,
-                "error_fixing": agent_config.error_fixing,
-                "accessibility": agent_config.accessibility,
-                "content_update": agent_config.content_update,
-                "content_generation": agent_config.content_generation,
-            }
-
-            if enabled_map.get(agent_name, False) and agent_name not in active:
+            # self.agents only holds agents enabled in config
+            if agent_name in self.agents and agent_name not in active:
                 active.append(agent_name)
                 self.logger.info(
                     "Agent scheduled",
@@ -230,27 +232,41 @@ class ManagerAgent:
             patterns = self.AGENT_FILE_PATTERNS.get(agent_name, [])
             paths_needed.update(patterns)
 
-        for path in paths_needed:
-            try:
-                file_data = self.github.get_file(path, branch)
-                if file_data:
-                    fetched[path] = file_data["content"]
-                    self.logger.debug("Fetched file", path=path)
-            except Exception as e:
-                self.logger.debug("File not found (skipping)", path=path, error=str(e))
+        # One tree listing replaces a 404 round-trip for every missing candidate.
+        # GitHub reads are blocking HTTP calls, so they run in worker threads.
+        try:
+            existing = await asyncio.to_thread(self.github.list_files, branch)
+        except Exception as e:
+            self.logger.debug("Tree listing failed, probing paths individually", error=str(e))
+            existing = None
+        if existing is not None:
+            paths_needed.intersection_update(existing)
+
+        # Overlap the per-file reads, bounded by the session's connection pool
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+
+        async def fetch_one(path: str) -> None:
+            async with semaphore:
+                try:
+                    file_data = await asyncio.to_thread(self.github.get_file, path, branch)
+                    if file_data:
+                        fetched[path] = file_data["content"]
+                        self.logger.debug("Fetched file", path=path)
+                except Exception as e:
+                    self.logger.debug("File not found (skipping)", path=path, error=str(e))
+
+        await asyncio.gather(*(fetch_one(path) for path in sorted(paths_needed)))
 
         self.logger.info("Files fetched", count=len(fetched))
         return {"file_contents": fetched}
 
     async def _run_agents(self, state: PipelineState) -> Dict[str, Any]:
-        """Run all active specialized agents (concurrently where safe)."""
+        """Run all active specialized agents concurrently, with staggered starts."""
         active_agents = state.get("active_agents", [])
         file_contents = state.get("file_contents", {})
         issues = state.get("issues", {})
         url = state.get("url", "")
 
-        results: List[Dict[str, Any]] = []
-
         # Build input for each agent
         agent_inputs = {
             "seo": {
@@ -289,45 +305,47 @@ class ManagerAgent:
             },
         }
 
-        # Run each agent sequentially (to respect 40 RPM rate limit)
-        for i, agent_name in enumerate(active_agents):
-            if i > 0:
-                # 40 RPM safety margin (~1.5s between LLM-backed agent calls)
-                await asyncio.sleep(1.5)
+        async def run_one(index: int, agent_name: str) -> Optional[Dict[str, Any]]:
+            # Stagger start times instead of serializing whole runs: requests
+            # still begin ~1.5s apart (40 RPM safety margin) but overlap in flight
+            if index > 0:
+                await asyncio.sleep(self.AGENT_START_INTERVAL * index)
 
             agent = self.agents.get(agent_name)
             if not agent:
-                continue
+                return None
 
             self.logger.info("Running agent", agent=agent_name)
             try:
                 agent_input = agent_inputs.get(agent_name, {"url": url})
                 result = await agent.process(agent_input)
-                results.append(
-                    {
-                        "agent": agent_name,
-                        "status": result.get("status"),
-                        "changes": result.get("changes", []),
-                        "summary": result.get("summary", ""),
-                        "error": result.get("error"),
-                    }
-                )
                 self.logger.info(
                     "Agent complete",
                     agent=agent_name,
                     changes=len(result.get("changes", [])),
                     status=result.get("status"),
                 )
+                return {
+                    "agent": agent_name,
+                    "status": result.get("status"),
+                    "changes": result.get("changes", []),
+                    "summary": result.get("summary", ""),
+                    "error": result.get("error"),
+                }
             except Exception as e:
                 self.logger.error("Agent failed", agent=agent_name, error=str(e))
-                results.append(
-                    {
-                        "agent": agent_name,
-                        "status": "error",
-                        "error": str(e),
-                        "changes": [],
-                    }
-                )
+                return {
+                    "agent": agent_name,
+                    "status": "error",
+                    "error": str(e),
+                    "changes": [],
+                }
+
+        # gather preserves input order, so results stay in priority order
+        outcomes = await asyncio.gather(
+            *(run_one(i, name) for i, name in enumerate(active_agents))
+        )
+        results = [r for r in outcomes if r is not None]
 
         return {"agent_results": results}
 
@@ -363,6 +381,10 @@ class ManagerAgent:
 
     # ── Public API ────────────────────────────────────────────────────────────
 
+    async def cleanup(self) -> None:
+        """Clean up every specialized agent concurrently; failures are logged, not raised."""
+        await cleanup_agents(self.agents, self.logger)
+
     async def process(self, read_result: Dict[str, Any]) -> Dict[str, Any]:
         """
         Main entry point. Takes ReadAgent output, returns all file changes.
@@ -389,18 +411,17 @@ class ManagerAgent:
 
         final_state = await self._graph.ainvoke(initial_state)
 
+        agents_run: List[Any] = []
+        summaries: Dict[str, Any] = {}
+        for r in final_state.get("agent_results", []):
+            if isinstance(r, dict):
+                agents_run.append(r.get("agent"))
+                summaries[r.get("agent", "")] = r.get("summary", "")
+
         return {
             "status": "success",
             "url": final_state.get("url", ""),
-            "agents_run": [
-                r.get("agent")
-                for r in final_state.get("agent_results", [])
-                if isinstance(r, dict)
-            ],
+            "agents_run": agents_run,
             "all_changes": final_state.get("all_changes", []),
-            "summaries": {
-                r.get("agent", ""): r.get("summary", "")
-                for r in final_state.get("agent_results", [])
-                if isinstance(r, dict)
-            },
+            "summaries": summaries,
         }
@@ -9,7 +9,9 @@ Flow:
 4. Store results in memory
 """
 from __future__ import annotations
+import asyncio
 from datetime import datetime
+from itertools import islice
 from typing import Any, Dict, List
 import structlog
 
@@ -23,6 +25,16 @@ CRITICAL = 50
 POOR = 70
 NEEDS_WORK = 85
 
+# (score key, task type, issue key) for every category that can spawn a task
+TASK_MAP = (
+    ("performance", "performance_optimization", "performance"),
+    ("seo", "seo_optimization", "seo"),
+    ("accessibility", "accessibility_fix", "accessibility"),
+    ("best_practices", "error_fixing", "best_practices"),
+)
+
+PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
 
 class ReadAgent(BaseAgent):
     """Audits the target website and structures findings."""
@@ -43,7 +55,9 @@ class ReadAgent(BaseAgent):
         try:
             self.logger.info("Starting website audit", url=url)
 
-            audit_result = run_audit(url)
+            # Lighthouse runs for up to minutes in a blocking subprocess —
+            # keep it off the event loop
+            audit_result = await asyncio.to_thread(run_audit, url)
             scores = audit_result["scores"]
             issues = audit_result["issues"]
 
@@ -87,14 +101,7 @@ class ReadAgent(BaseAgent):
     ) -> List[Dict[str, Any]]:
         tasks = []
 
-        task_map = [
-            ("performance", "performance_optimization", "performance"),
-            ("seo", "seo_optimization", "seo"),
-            ("accessibility", "accessibility_fix", "accessibility"),
-            ("best_practices", "error_fixing", "best_practices"),
-        ]
-
-        for score_key, task_type, issue_key in task_map:
+        for score_key, task_type, issue_key in TASK_MAP:
             score = scores.get(score_key, 100)
             if score >= NEEDS_WORK:
                 continue
@@ -113,8 +120,7 @@ class ReadAgent(BaseAgent):
                 }
             )
 
-        priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-        tasks.sort(key=lambda t: priority_order.get(t["priority"], 4))
+        tasks.sort(key=lambda t: PRIORITY_ORDER.get(t["priority"], 4))
         return tasks
 
     def _priority(self, score: float) -> str:
@@ -139,14 +145,16 @@ class ReadAgent(BaseAgent):
             "",
             "HIGH SEVERITY ISSUES:",
         ]
+        found_high = False
         for category, category_issues in issues.items():
-            high = [i for i in category_issues if i["severity"] == "high"]
-            for issue in high[:3]:
+            high = (i for i in category_issues if i["severity"] == "high")
+            for issue in islice(high, 3):
+                found_high = True
                 lines.append(f"  [{category.upper()}] {issue['title']}")
                 if issue.get("description"):
                     lines.append(f"    → {issue['description'][:120]}")
 
-        if not any(any(i["severity"] == "high" for i in v) for v in issues.values()):
+        if not found_high:
             lines.append("  No high severity issues found!")
 
         return "\n".join(lines)
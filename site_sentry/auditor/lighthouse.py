@@ -14,9 +14,34 @@ from typing import Any, Dict, List
 
 import structlog
 
+try:
+    import orjson  # optional: much faster on multi-MB Lighthouse reports
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
 logger = structlog.get_logger()
 
 
+def _loads(raw: bytes) -> Any:
+    """Parse JSON with orjson when installed, falling back to the stdlib."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# (score key, Lighthouse category id) — Lighthouse uses a hyphenated id for best practices
+SCORE_CATEGORIES = (
+    ("performance", "performance"),
+    ("seo", "seo"),
+    ("accessibility", "accessibility"),
+    ("best_practices", "best-practices"),
+)
+
+# scoreDisplayMode values that never indicate a real failure
+LOW_SEVERITY_MODES = frozenset({"notApplicable", "manual"})
+UNSCORED_MODES = frozenset({"notApplicable", "informative", "manual"})
+
+
 class LighthouseError(Exception):
     """Raised when Lighthouse CLI fails or returns unusable output."""
 
@@ -39,10 +64,8 @@ def _normalize(lhr: Dict[str, Any], url: str) -> Dict[str, Any]:
     """
     cats = lhr.get("categories") or {}
     scores = {
-        "performance": _score_to_hundred((cats.get("performance") or {}).get("score")),
-        "seo": _score_to_hundred((cats.get("seo") or {}).get("score")),
-        "accessibility": _score_to_hundred((cats.get("accessibility") or {}).get("score")),
-        "best_practices": _score_to_hundred((cats.get("best-practices") or {}).get("score")),
+        key: _score_to_hundred((cats.get(category_id) or {}).get("score"))
+        for key, category_id in SCORE_CATEGORIES
     }
     return {"scores": scores, "url": url}
 
@@ -50,7 +73,7 @@ def _normalize(lhr: Dict[str, Any], url: str) -> Dict[str, Any]:
 def _severity_for_audit(audit: Dict[str, Any]) -> str:
     score = audit.get("score")
     smode = audit.get("scoreDisplayMode") or ""
-    if smode in ("notApplicable", "manual"):
+    if smode in LOW_SEVERITY_MODES:
         return "low"
     if score is None:
         return "medium"
@@ -73,7 +96,7 @@ def _issues_for_category(lhr: Dict[str, Any], category_id: str) -> List[Dict[str
         audit = audits.get(aid) or {}
         score = audit.get("score")
         smode = audit.get("scoreDisplayMode") or ""
-        if smode in ("notApplicable", "informative", "manual") and score is None:
+        if smode in UNSCORED_MODES and score is None:
             continue
         if score is not None and score >= 1:
             continue
@@ -128,7 +151,6 @@ def run_audit(url: str) -> Dict[str, Any]:
         proc = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=180,
             check=False,
         )
@@ -137,13 +159,15 @@ def run_audit(url: str) -> Dict[str, Any]:
     except OSError as e:
         raise LighthouseError(f"Failed to spawn Lighthouse: {e}") from e
 
+    # Keep stdout as bytes: both JSON parsers decode UTF-8 themselves, which
+    # avoids materializing a multi-MB str copy of the report first.
     out = proc.stdout.strip()
     if proc.returncode != 0 and not out:
-        err = (proc.stderr or "").strip() or "unknown error"
+        err = (proc.stderr or b"").decode("utf-8", "replace").strip() or "unknown error"
         raise LighthouseError(f"Lighthouse exited {proc.returncode}: {err[:500]}")
 
     try:
-        lhr = json.loads(out)
+        lhr = _loads(out)
     except json.JSONDecodeError as e:
         raise LighthouseError("Lighthouse did not return valid JSON") from e
 
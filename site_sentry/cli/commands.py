@@ -21,11 +21,32 @@ logger = structlog.get_logger()
 
 def _configure_logging(level: str, log_file: Optional[str] = None) -> None:
     """Configure structlog for CLI output."""
-    logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
+    log_level = getattr(logging, level.upper(), logging.INFO)
+    logging.basicConfig(level=log_level)
+    # Drop below-threshold events at the call site, before any processor runs —
+    # per-file debug logging on hot paths then costs next to nothing
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
     )
 
 
+def _run_async(coro):
+    """Run ``coro`` on uvloop when installed, otherwise on the default asyncio loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
+async def _run_pipeline(pipeline, url: Optional[str], dry_run: bool) -> dict:
+    """Run the pipeline and always release agent resources afterwards."""
+    try:
+        return await pipeline.run(url=url, dry_run=dry_run)
+    finally:
+        await pipeline.cleanup()
+
+
 @click.group()
 @click.version_option(version="1.0.0", prog_name="sentry")
 def cli():
@@ -54,6 +75,8 @@ def cli():
 @click.option("--github-repo", default="", help="GitHub repo name")
 def init(url: str, workspace: str, github_owner: str, github_repo: str):
     """Initialize Site-Sentry in the current directory."""
+    from site_sentry.config.schema import YAML_DUMPER, YAML_LOADER
+
     config_path = Path("sentry.config.yaml")
 
     if config_path.exists():
@@ -66,7 +89,7 @@ def init(url: str, workspace: str, github_owner: str, github_repo: str):
         Path(__file__).parent.parent / "config" / "sentry.config.yaml.template"
     )
     with open(template_path, encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=YAML_LOADER)
 
     # Apply user inputs
     config["website_url"] = url
@@ -77,7 +100,13 @@ def init(url: str, workspace: str, github_owner: str, github_repo: str):
         config["github"]["repo_name"] = github_repo
 
     with open(config_path, "w", encoding="utf-8") as f:
-        yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
+        yaml.dump(
+            config,
+            f,
+            Dumper=YAML_DUMPER,
+            default_flow_style=False,
+            allow_unicode=True,
+        )
 
     # Create required directories
     for d in ["logs", "data/memory/vectors", "temp/lighthouse"]:
@@ -170,7 +199,7 @@ def run(config_path: str, url: Optional[str], dry_run: bool, verbose: bool):
     pipeline = SentryPipeline(config)
 
     try:
-        result = asyncio.run(pipeline.run(url=url, dry_run=dry_run))
+        result = _run_async(_run_pipeline(pipeline, url, dry_run))
     except KeyboardInterrupt:
         click.echo("\nAborted by user.")
         return
@@ -1,11 +1,34 @@
 """Single source of truth for all Site-Sentry configuration."""
 from __future__ import annotations
+import copy
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Literal
+from typing import Any, Dict, List, Optional, Literal, Tuple
 import yaml
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+# libyaml-backed loader/dumper when PyYAML was built with it, pure Python otherwise
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Parsed YAML keyed by resolved path; reused until the file's mtime/size changes
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _load_yaml_cached(path: Path) -> Dict[str, Any]:
+    """Parse a YAML config once per file revision and hand out private copies."""
+    st = path.stat()
+    key = str(path.resolve())
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _YAML_CACHE.get(key)
+    if cached is None or cached[0] != stamp:
+        with open(path) as f:
+            data = yaml.load(f, Loader=YAML_LOADER) or {}
+        _YAML_CACHE[key] = (stamp, data)
+    else:
+        data = cached[1]
+    return copy.deepcopy(data)
+
 
 class LLMConfig(BaseModel):
     """LLM provider configuration."""
@@ -24,6 +47,9 @@ class MemoryConfig(BaseModel):
     vector_store_path: str = "data/memory/vectors"
     collection_prefix: str = "sentry"
     enabled: bool = True
+    # Optional Chroma server; when set, vectors live there instead of in-process
+    host: Optional[str] = None
+    port: int = 8000
 
 
 class GitHubConfig(BaseModel):
@@ -92,22 +118,23 @@ class SentryConfig(BaseModel):
 
     @property
     def api_key(self) -> str:
-        return os.environ.get("NVIDIA_API_KEY", "")
+        return self._api_key
 
     @property
     def github_token(self) -> str:
-        return os.environ.get("GITHUB_TOKEN", "")
+        return self._github_token
 
     @classmethod
     def load(cls, config_path: str) -> "SentryConfig":
         """Load config from YAML file with env var overrides."""
         path = Path(config_path)
-        if not path.exists():
+        # The stat inside _load_yaml_cached doubles as the existence check
+        try:
+            data = _load_yaml_cached(path)
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Config not found at {config_path}. Run 'sentry init' first."
-            )
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+            ) from None
 
         # Allow env vars to override YAML top-level keys
         if os.environ.get("TARGET_URL"):
@@ -1,5 +1,5 @@
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, cleanup_agents
 from .llm_provider import get_llm, LLMRole
 from .memory import AgentMemory
 
-__all__ = ["BaseAgent", "get_llm", "LLMRole", "AgentMemory"]
+__all__ = ["BaseAgent", "cleanup_agents", "get_llm", "LLMRole", "AgentMemory"]
@@ -10,9 +10,10 @@ import asyncio
 import json
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Mapping, Union
 
 import structlog
+from langchain_core.messages import HumanMessage
 
 from site_sentry.config.schema import SentryConfig
 from site_sentry.core.llm_provider import get_llm, LLMRole
@@ -20,6 +21,10 @@ from site_sentry.core.memory import AgentMemory
 
 logger = structlog.get_logger()
 
+# Compiled once — _extract_json runs on every LLM response
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*([\s\S]+?)```", re.IGNORECASE)
+_JSON_OBJECT_RE = re.compile(r"\{[\s\S]+\}")
+
 
 def _message_content_text(content: Union[str, list, Any]) -> str:
     """Normalize LangChain message content to a single string."""
@@ -38,6 +43,18 @@ def _message_content_text(content: Union[str, list, Any]) -> str:
     return str(content)
 
 
+async def cleanup_agents(agents: Mapping[str, Any], log: Any) -> None:
+    """Clean up every agent in ``agents`` concurrently; failures are logged, not raised."""
+    names = list(agents)
+    results = await asyncio.gather(
+        *(agents[name].cleanup() for name in names),
+        return_exceptions=True,
+    )
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            log.warning("Agent cleanup failed", agent=name, error=str(result))
+
+
 class BaseAgent(ABC):
     """Abstract base for all Site-Sentry agents."""
 
@@ -50,12 +67,7 @@ class BaseAgent(ABC):
 
         self.llm = get_llm(role=self.llm_role, config=config)
 
-        self.memory = AgentMemory(
-            agent_name=name,
-            db_path=config.memory.vector_store_path,
-            enabled=config.memory.enabled,
-            collection_prefix=config.memory.collection_prefix,
-        )
+        self.memory = AgentMemory.from_config(name, config)
 
     @abstractmethod
     async def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -83,7 +95,7 @@ class BaseAgent(ABC):
         """
         text = text.strip()
 
-        fenced = re.search(r"```(?:json)?\s*([\s\S]+?)```", text, re.IGNORECASE)
+        fenced = _FENCED_JSON_RE.search(text)
         if fenced:
             text = fenced.group(1).strip()
 
@@ -92,7 +104,7 @@ class BaseAgent(ABC):
         except json.JSONDecodeError:
             pass
 
-        obj_match = re.search(r"\{[\s\S]+\}", text)
+        obj_match = _JSON_OBJECT_RE.search(text)
         if obj_match:
             try:
                 return json.loads(obj_match.group(0))
@@ -131,6 +143,15 @@ class BaseAgent(ABC):
             f"LLM call failed after {max_retries} attempts: {last_error}"
         )
 
+    async def _request_changes(self, system_message: Any, prompt: str) -> Dict[str, Any]:
+        """Ask the LLM for a JSON change plan and wrap it as a success result."""
+        raw = await self._invoke_llm([system_message, HumanMessage(content=prompt)])
+        result = self._extract_json(raw)
+        return self._success_result(
+            changes=self._normalize_change_list(result.get("changes")),
+            summary=str(result.get("summary", "")),
+        )
+
     def _normalize_change_list(self, raw: Any) -> List[Dict[str, str]]:
         """Parse LLM JSON ``changes`` into GitHub-compatible dicts."""
         if not isinstance(raw, list):
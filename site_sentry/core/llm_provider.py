@@ -40,16 +40,10 @@ def get_llm(role: LLMRole, config) -> BaseChatModel:
 
     logger.info("Initializing LLM", provider=provider, model=model_name, role=role)
 
-    if provider == "nvidia_nim":
-        return _get_nvidia_nim(model_name, config, api_key)
-    elif provider == "google":
-        return _get_google(model_name, config, api_key)
-    elif provider == "groq":
-        return _get_groq(model_name, config, api_key)
-    elif provider == "openai":
-        return _get_openai(model_name, config, api_key)
-    else:
-        raise ValueError(f"Unknown provider: {provider}. Choose: nvidia_nim, google, groq, openai")
+    factory = _PROVIDERS.get(provider)
+    if factory is None:
+        raise ValueError(f"Unknown provider: {provider}. Choose: {', '.join(_PROVIDERS)}")
+    return factory(model_name, config, api_key)
 
 
 def _get_nvidia_nim(model_name: str, config, api_key: str) -> BaseChatModel:
@@ -114,3 +108,12 @@ def _get_openai(model_name: str, config, api_key: str) -> BaseChatModel:
         temperature=config.llm.temperature,
         max_tokens=config.llm.max_tokens,
     )
+
+
+# Provider name → factory, resolved with a single dict lookup in get_llm()
+_PROVIDERS = {
+    "nvidia_nim": _get_nvidia_nim,
+    "google": _get_google,
+    "groq": _get_groq,
+    "openai": _get_openai,
+}
@@ -2,18 +2,42 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import structlog
 
 logger = structlog.get_logger()
 
+# Chroma clients shared by every AgentMemory in the process, keyed by
+# (pid, host, port, path). The pid makes a forked child open its own client
+# rather than reuse sqlite/HTTP handles inherited from the parent.
+_CLIENTS: Dict[Tuple[int, str, int, str], Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _shared_client(db_path: str, host: Optional[str], port: int) -> Any:
+    import chromadb
+
+    key = (os.getpid(), host or "", port if host else 0, "" if host else db_path)
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            if host:
+                client = chromadb.HttpClient(host=host, port=port)
+            else:
+                client = chromadb.PersistentClient(path=db_path)
+            _CLIENTS[key] = client
+    return client
+
 
 class AgentMemory:
     """
     Minimal optional memory wrapper. When disabled or Chroma fails to load,
-    all operations are safe no-ops.
+    all operations are safe no-ops. Uses an embedded PersistentClient by
+    default, or a Chroma server when ``host`` is given.
     """
 
     def __init__(
@@ -22,10 +46,14 @@ class AgentMemory:
         db_path: str = "",
         enabled: bool = True,
         collection_prefix: str = "sentry",
+        host: Optional[str] = None,
+        port: int = 8000,
     ) -> None:
         self.agent_name = agent_name
         self.db_path = db_path
         self.collection_prefix = collection_prefix
+        self.host = host
+        self.port = port
         self._enabled = bool(enabled)
         self._client: Any = None
         self._collection: Any = None
@@ -34,9 +62,7 @@ class AgentMemory:
             return
 
         try:
-            import chromadb  # noqa: F401
-
-            self._client = chromadb.PersistentClient(path=db_path)
+            self._client = _shared_client(db_path, host, port)
             coll_name = f"{collection_prefix}_{agent_name}"
             self._collection = self._client.get_or_create_collection(name=coll_name)
         except Exception as exc:
@@ -49,6 +75,18 @@ class AgentMemory:
             self._client = None
             self._collection = None
 
+    @classmethod
+    def from_config(cls, agent_name: str, config: Any) -> "AgentMemory":
+        """Build memory for ``agent_name`` from a SentryConfig's ``memory`` section."""
+        return cls(
+            agent_name=agent_name,
+            db_path=config.memory.vector_store_path,
+            enabled=config.memory.enabled,
+            collection_prefix=config.memory.collection_prefix,
+            host=config.memory.host,
+            port=config.memory.port,
+        )
+
     def store(self, data: Dict[str, Any], doc_type: str) -> None:
         if not self._enabled or self._collection is None:
             return
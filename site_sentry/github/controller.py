@@ -11,6 +11,7 @@ from urllib.parse import quote
 
 import requests
 import structlog
+from requests.adapters import HTTPAdapter
 
 logger = structlog.get_logger()
 
@@ -38,6 +39,10 @@ class GitHubController:
 
     BASE_URL = "https://api.github.com"
 
+    # Pooled connections kept per host; callers sharing this controller across
+    # threads should cap their concurrency at this value
+    MAX_CONNECTIONS = 8
+
     def __init__(self, token: str, repo_owner: str, repo_name: str):
         if not token:
             raise ValueError("GitHub token is required. Set GITHUB_TOKEN in .env")
@@ -49,8 +54,19 @@ class GitHubController:
             "Accept": "application/vnd.github+json",
             "X-GitHub-Api-Version": "2022-11-28",
         }
+        # One pooled session: keeps TLS connections to api.github.com alive
+        # across the dozens of calls a run makes
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+        self._session.mount("https://", HTTPAdapter(pool_maxsize=self.MAX_CONNECTIONS))
+        # Head SHAs of branches this controller created or committed to
+        self._branch_heads: Dict[str, str] = {}
         logger.info("GitHub controller initialized", repo=f"{repo_owner}/{repo_name}")
 
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+        self._session.close()
+
     def _url(self, path: str) -> str:
         return f"{self.BASE_URL}/repos/{self.repo_owner}/{self.repo_name}{path}"
 
@@ -59,7 +75,7 @@ class GitHubController:
         return "/".join(quote(segment, safe="") for segment in file_path.split("/"))
 
     def _get(self, path: str) -> Dict:
-        r = requests.get(self._url(path), headers=self._headers, timeout=60)
+        r = self._session.get(self._url(path), timeout=60)
         if not r.ok:
             raise GitHubError(
                 f"GET {path} failed: {_response_error_message(r)}", r.status_code
@@ -67,9 +83,7 @@ class GitHubController:
         return r.json()
 
     def _post(self, path: str, payload: Dict) -> Dict:
-        r = requests.post(
-            self._url(path), json=payload, headers=self._headers, timeout=60
-        )
+        r = self._session.post(self._url(path), json=payload, timeout=60)
         if not r.ok:
             raise GitHubError(
                 f"POST {path} failed: {_response_error_message(r)}", r.status_code
@@ -77,15 +91,21 @@ class GitHubController:
         return r.json()
 
     def _put(self, path: str, payload: Dict) -> Dict:
-        r = requests.put(
-            self._url(path), json=payload, headers=self._headers, timeout=60
-        )
+        r = self._session.put(self._url(path), json=payload, timeout=60)
         if not r.ok:
             raise GitHubError(
                 f"PUT {path} failed: {_response_error_message(r)}", r.status_code
             )
         return r.json()
 
+    def _patch(self, path: str, payload: Dict) -> Dict:
+        r = self._session.patch(self._url(path), json=payload, timeout=60)
+        if not r.ok:
+            raise GitHubError(
+                f"PATCH {path} failed: {_response_error_message(r)}", r.status_code
+            )
+        return r.json()
+
     def get_default_branch_sha(self, branch: str) -> str:
         data = self._get(f"/git/refs/heads/{quote(branch, safe='')}")
         return data["object"]["sha"]
@@ -98,6 +118,7 @@ class GitHubController:
                 {"ref": f"refs/heads/{branch_name}", "sha": base_sha},
             )
             logger.info("Branch created", branch=branch_name, from_branch=base_branch)
+            self._branch_heads[branch_name] = result["object"]["sha"]
             return {"branch": branch_name, "sha": result["object"]["sha"]}
         except GitHubError as e:
             if e.status_code == 422:
@@ -116,30 +137,28 @@ class GitHubController:
                 return None
             raise
 
-    def commit_file(
-        self,
-        file_path: str,
-        content: str,
-        branch: str,
-        commit_message: str,
-        existing_sha: Optional[str] = None,
-    ) -> Dict:
-        encoded = base64.b64encode(content.encode("utf-8")).decode("utf-8")
-        payload: Dict[str, Any] = {
-            "message": commit_message,
-            "content": encoded,
-            "branch": branch,
-        }
-        if existing_sha:
-            payload["sha"] = existing_sha
+    def list_files(self, branch: str) -> Optional[List[str]]:
+        """
+        List every blob path on ``branch`` with a single recursive tree request.
+        Returns None when GitHub truncates the listing (very large repos).
+        """
+        data = self._get(f"/git/trees/{quote(branch, safe='')}?recursive=1")
+        if data.get("truncated"):
+            logger.warning("Repository tree listing truncated", branch=branch)
+            return None
+        return [
+            entry["path"]
+            for entry in data.get("tree", [])
+            if entry.get("type") == "blob"
+        ]
 
-        enc = self._encode_content_path(file_path)
-        result = self._put(f"/contents/{enc}", payload)
-        logger.info("File committed", path=file_path, branch=branch)
+    def _blob_modes(self, tree_sha: str) -> Dict[str, str]:
+        """Map each executable blob in ``tree_sha`` to its mode (100755)."""
+        data = self._get(f"/git/trees/{tree_sha}?recursive=1")
         return {
-            "path": file_path,
-            "branch": branch,
-            "commit_sha": result["commit"]["sha"],
+            entry["path"]: entry["mode"]
+            for entry in data.get("tree", [])
+            if entry.get("type") == "blob" and entry.get("mode") == "100755"
         }
 
     def commit_files(
@@ -148,22 +167,53 @@ class GitHubController:
         branch: str,
         commit_message_prefix: str = "fix",
     ) -> List[Dict]:
-        results = []
-        for change in changes:
-            path = change["path"]
-            content = change["content"]
-            existing = self.get_file(path, branch)
-            existing_sha = existing["sha"] if existing else None
-            commit_msg = f"{commit_message_prefix}: update {path}"
-            result = self.commit_file(
-                file_path=path,
-                content=content,
-                branch=branch,
-                commit_message=commit_msg,
-                existing_sha=existing_sha,
+        """
+        Commit all ``changes`` to ``branch`` as a single commit via the Git Data API
+        (one tree + one commit + one ref update instead of a GET/PUT per file).
+        Existing executable files keep their mode; anything else, including a
+        path that was a symlink, is written as a regular file.
+        """
+        if not changes:
+            return []
+
+        paths = [change["path"] for change in changes]
+        if len(paths) == 1:
+            commit_msg = f"{commit_message_prefix}: update {paths[0]}"
+        else:
+            commit_msg = f"{commit_message_prefix}: update {len(paths)} files\n\n" + "\n".join(
+                f"- {path}" for path in paths
             )
-            results.append(result)
-        return results
+
+        head_sha = self._branch_heads.get(branch) or self.get_default_branch_sha(branch)
+        base_tree = self._get(f"/git/commits/{head_sha}")["tree"]["sha"]
+        modes = self._blob_modes(base_tree)
+        tree = self._post(
+            "/git/trees",
+            {
+                "base_tree": base_tree,
+                "tree": [
+                    {
+                        "path": change["path"],
+                        "mode": modes.get(change["path"], "100644"),
+                        "type": "blob",
+                        "content": change["content"],
+                    }
+                    for change in changes
+                ],
+            },
+        )
+        commit = self._post(
+            "/git/commits",
+            {"message": commit_msg, "tree": tree["sha"], "parents": [head_sha]},
+        )
+        self._patch(f"/git/refs/heads/{quote(branch, safe='/')}", {"sha": commit["sha"]})
+        self._branch_heads[branch] = commit["sha"]
+
+        logger.info("Files committed", count=len(paths), branch=branch, commit=commit["sha"])
+        return [
+            {"path": path, "branch": branch, "commit_sha": commit["sha"]}
+            for path in paths
+        ]
 
     def create_pull_request(
         self,
@@ -187,10 +237,9 @@ class GitHubController:
 
         if labels:
             try:
-                lr = requests.post(
+                lr = self._session.post(
                     self._url(f"/issues/{pr_number}/labels"),
                     json={"labels": labels},
-                    headers=self._headers,
                     timeout=60,
                 )
                 if not lr.ok:
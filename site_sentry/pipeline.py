@@ -4,11 +4,12 @@ Main Site-Sentry pipeline — orchestrates the full run.
 ReadAgent → ManagerAgent → GitHubController → PR
 """
 from __future__ import annotations
-from datetime import datetime
+import time
 from typing import Any, Dict, Optional
 import structlog
 
 from site_sentry.config.schema import SentryConfig
+from site_sentry.core.base_agent import cleanup_agents
 from site_sentry.agents.read_agent import ReadAgent
 from site_sentry.agents.manager_agent import ManagerAgent
 from site_sentry.github.controller import GitHubController, GitHubError
@@ -16,6 +17,11 @@ from site_sentry.github.controller import GitHubController, GitHubError
 logger = structlog.get_logger()
 
 
+def _elapsed_seconds(start_time: float) -> int:
+    """Whole seconds since a ``time.monotonic()`` reading (immune to clock changes)."""
+    return int(time.monotonic() - start_time)
+
+
 class SentryPipeline:
     """Full end-to-end Site-Sentry pipeline."""
 
@@ -53,43 +59,40 @@ class SentryPipeline:
             Pipeline result summary
         """
         target_url = url or self.config.website_url
-        self.logger.info("Pipeline starting", url=target_url, dry_run=dry_run)
-        start_time = datetime.now()
+        # Bind run context once so every event below carries it
+        log = self.logger.bind(url=target_url, dry_run=dry_run)
+        log.info("Pipeline starting")
+        start_time = time.monotonic()
 
         # ── Step 1: Audit ─────────────────────────────────────────────────
-        self.logger.info("Step 1/4: Running Lighthouse audit...")
+        log.info("Step 1/4: Running Lighthouse audit...")
         read_result = await self.read_agent.process({"url": target_url})
 
         if read_result.get("status") != "success":
-            return self._failed(f"Audit failed: {read_result.get('error')}", start_time)
+            return self._failed(f"Audit failed: {read_result.get('error')}", start_time, log)
 
+        # ReadAgent already logs the audit scores and task count
         scores = read_result.get("scores", {})
-        self.logger.info(
-            "Audit complete",
-            performance=scores.get("performance"),
-            seo=scores.get("seo"),
-            tasks=len(read_result.get("tasks", [])),
-        )
 
         # ── Step 2: Plan + Fix ────────────────────────────────────────────
-        self.logger.info("Step 2/4: Running specialized agents...")
+        log.info("Step 2/4: Running specialized agents...")
         manager_result = await self.manager_agent.process(read_result)
 
         all_changes = manager_result.get("all_changes", [])
-        self.logger.info("Agents complete", changes=len(all_changes))
+        log.info("Agents complete", changes=len(all_changes))
 
         if not all_changes:
             return {
                 "status": "success",
                 "message": "No changes needed — your site is in great shape!",
                 "scores": scores,
-                "duration_seconds": (datetime.now() - start_time).seconds,
+                "duration_seconds": _elapsed_seconds(start_time),
             }
 
         # ── Step 3: Create Branch & Commit ────────────────────────────────
         if dry_run or not self.github:
             mode = "dry-run" if dry_run else "no-github"
-            self.logger.info(f"Skipping commit ({mode})", changes=len(all_changes))
+            log.info(f"Skipping commit ({mode})", changes=len(all_changes))
             return self._report(
                 read_result,
                 manager_result,
@@ -98,7 +101,7 @@ class SentryPipeline:
                 start_time=start_time,
             )
 
-        self.logger.info("Step 3/4: Creating branch and committing fixes...")
+        log.info("Step 3/4: Creating branch and committing fixes...")
         branch_name = GitHubController.generate_branch_name(
             self.config.github.branch_prefix
         )
@@ -109,20 +112,18 @@ class SentryPipeline:
                 base_branch=self.config.github.base_branch,
             )
 
-            commit_results = self.github.commit_files(
+            # commit_files logs the resulting commit itself
+            self.github.commit_files(
                 changes=all_changes,
                 branch=branch_name,
                 commit_message_prefix="fix(sentry)",
             )
-            self.logger.info(
-                "Files committed", count=len(commit_results), branch=branch_name
-            )
 
         except GitHubError as e:
-            return self._failed(f"GitHub error during commit: {e}", start_time)
+            return self._failed(f"GitHub error during commit: {e}", start_time, log)
 
         # ── Step 4: Open PR ────────────────────────────────────────────────
-        self.logger.info("Step 4/4: Opening pull request...")
+        log.info("Step 4/4: Opening pull request...")
         pr_body = self._build_pr_body(scores, manager_result)
 
         try:
@@ -133,14 +134,23 @@ class SentryPipeline:
                 base_branch=self.config.github.base_branch,
                 labels=self.config.github.pr_labels,
             )
-            self.logger.info("PR created", url=pr_result["url"])
+            log.info("PR created", pr_url=pr_result["url"])
         except GitHubError as e:
-            return self._failed(f"GitHub PR creation failed: {e}", start_time)
+            return self._failed(f"GitHub PR creation failed: {e}", start_time, log)
 
         return self._report(
             read_result, manager_result, pr_result, "committed", start_time
         )
 
+    async def cleanup(self) -> None:
+        """Release resources held by the read and manager agents and GitHub client."""
+        await cleanup_agents(
+            {"read_agent": self.read_agent, "manager_agent": self.manager_agent},
+            self.logger,
+        )
+        if self.github:
+            self.github.close()
+
     def _build_pr_body(self, scores: Dict[str, Any], manager_result: Dict[str, Any]) -> str:
         lines = [
             "## 🤖 Site-Sentry Automated Fixes",
@@ -183,9 +193,9 @@ class SentryPipeline:
         manager_result: Dict[str, Any],
         pr_result: Optional[Dict[str, Any]],
         mode: str,
-        start_time: datetime,
+        start_time: float,
     ) -> Dict[str, Any]:
-        duration = (datetime.now() - start_time).seconds
+        duration = _elapsed_seconds(start_time)
         return {
             "status": "success",
             "mode": mode,
@@ -197,10 +207,10 @@ class SentryPipeline:
             "duration_seconds": duration,
         }
 
-    def _failed(self, error: str, start_time: datetime) -> Dict[str, Any]:
-        self.logger.error("Pipeline failed", error=error)
+    def _failed(self, error: str, start_time: float, log: Any) -> Dict[str, Any]:
+        log.error("Pipeline failed", error=error)
         return {
             "status": "error",
             "error": error,
-            "duration_seconds": (datetime.now() - start_time).seconds,
+            "duration_seconds": _elapsed_seconds(start_time),
         }
@@ -0,0 +1,19 @@
+"""Shared fixtures for the Site-Sentry test suite."""
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolate_config_env(monkeypatch):
+    """Keep a developer's TARGET_URL / WORKSPACE_PATH from overriding test configs."""
+    for var in ("TARGET_URL", "WORKSPACE_PATH"):
+        monkeypatch.delenv(var, raising=False)
+
+
+@pytest.fixture
+def mock_llm(monkeypatch):
+    """Pre-built LLM stand-in injected wherever agents resolve their model."""
+    llm = MagicMock()
+    monkeypatch.setattr("site_sentry.core.base_agent.get_llm", lambda role, config: llm)
+    return llm
@@ -3,42 +3,82 @@ Smoke tests for Site-Sentry.
 Tests config loading, LLM provider factory, and pipeline initialization.
 These tests do NOT make real API calls or run Lighthouse.
 """
-import os
+import asyncio
+import threading
+import time
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import yaml
 
+from site_sentry.config.schema import YAML_DUMPER
 
-def make_test_config(tmp_path: Path) -> Path:
-    """Create a minimal valid config for testing."""
-    config = {
-        "website_url": "https://example.com",
-        "workspace_path": str(tmp_path),
-        "llm": {
-            "provider": "nvidia_nim",
-            "manager_model": "deepseek-ai/deepseek-v3-2",
-            "agent_model": "deepseek-ai/deepseek-v4-flash",
-        },
-        "memory": {"enabled": False},
-        "github": {"repo_owner": "", "repo_name": ""},
-    }
-    config_path = tmp_path / "sentry.config.yaml"
-    with open(config_path, "w", encoding="utf-8") as f:
-        yaml.dump(config, f)
-    return config_path
+
+# Minimal valid config; workspace_path is filled in per fixture
+TEST_CONFIG = {
+    "website_url": "https://example.com",
+    "llm": {
+        "provider": "nvidia_nim",
+        "manager_model": "deepseek-ai/deepseek-v3-2",
+        "agent_model": "deepseek-ai/deepseek-v4-flash",
+    },
+    "memory": {"enabled": False},
+    "github": {"repo_owner": "", "repo_name": ""},
+}
+
+
+@pytest.fixture(scope="session")
+def config_path(tmp_path_factory) -> Path:
+    """Write a minimal valid config once and share it across the session."""
+    workspace = tmp_path_factory.mktemp("workspace")
+    config = {**TEST_CONFIG, "workspace_path": str(workspace)}
+    path = workspace / "sentry.config.yaml"
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.dump(config, f, Dumper=YAML_DUMPER)
+    return path
+
+
+@pytest.fixture
+def sentry_config(tmp_path):
+    """SentryConfig built in memory, for tests that don't exercise YAML loading."""
+    from site_sentry.config.schema import SentryConfig
+
+    return SentryConfig(**TEST_CONFIG, workspace_path=str(tmp_path))
 
 
 class TestConfig:
-    def test_load_valid_config(self, tmp_path):
+    def test_load_valid_config(self, config_path):
         from site_sentry.config.schema import SentryConfig
 
-        config_path = make_test_config(tmp_path)
         config = SentryConfig.load(str(config_path))
         assert config.website_url == "https://example.com"
         assert config.llm.provider == "nvidia_nim"
 
+    def test_load_reparses_after_edit(self, tmp_path):
+        """Cached YAML is reused until the file changes, then re-read."""
+        from site_sentry.config.schema import SentryConfig
+
+        path = tmp_path / "sentry.config.yaml"
+        path.write_text('website_url: "https://one.example"\n', encoding="utf-8")
+        with patch.object(yaml, "load", wraps=yaml.load) as spy:
+            assert SentryConfig.load(str(path)).website_url == "https://one.example"
+            assert SentryConfig.load(str(path)).website_url == "https://one.example"
+            assert spy.call_count == 1
+
+            path.write_text('website_url: "https://two.example.com"\n', encoding="utf-8")
+            assert SentryConfig.load(str(path)).website_url == "https://two.example.com"
+            assert spy.call_count == 2
+
+    def test_env_override_does_not_leak_into_cache(self, config_path, monkeypatch):
+        from site_sentry.config.schema import SentryConfig
+
+        monkeypatch.setenv("TARGET_URL", "https://override.example")
+        assert SentryConfig.load(str(config_path)).website_url == "https://override.example"
+
+        monkeypatch.delenv("TARGET_URL")
+        assert SentryConfig.load(str(config_path)).website_url == "https://example.com"
+
     def test_url_validation(self, tmp_path):
         from site_sentry.config.schema import SentryConfig
         from pydantic import ValidationError
@@ -53,26 +93,36 @@ class TestConfig:
             SentryConfig.load("nonexistent.yaml")
 
 
+FAKE_LIGHTHOUSE_REPORT = {
+    "fetchTime": "2025-01-01",
+    "lighthouseVersion": "12.0",
+    "userAgent": "test",
+    "categories": {
+        "performance": {"score": 0.72, "auditRefs": []},
+        "seo": {"score": 0.95, "auditRefs": []},
+        "best-practices": {"score": 0.83, "auditRefs": []},
+        "accessibility": {"score": 0.88, "auditRefs": []},
+    },
+    "audits": {},
+}
+
+
 class TestLighthouseNormalize:
-    def test_normalize_scores(self):
+    @pytest.mark.parametrize(
+        "category, expected",
+        [
+            ("performance", 72.0),
+            ("seo", 95.0),
+            ("best_practices", 83.0),
+            ("accessibility", 88.0),
+        ],
+    )
+    def test_normalize_scores(self, category, expected):
         """Test that we correctly extract scores from Lighthouse JSON."""
         from site_sentry.auditor.lighthouse import _normalize
 
-        fake_raw = {
-            "fetchTime": "2025-01-01",
-            "lighthouseVersion": "12.0",
-            "userAgent": "test",
-            "categories": {
-                "performance": {"score": 0.72, "auditRefs": []},
-                "seo": {"score": 0.95, "auditRefs": []},
-                "best-practices": {"score": 0.83, "auditRefs": []},
-                "accessibility": {"score": 0.88, "auditRefs": []},
-            },
-            "audits": {},
-        }
-        result = _normalize(fake_raw, "https://example.com")
-        assert result["scores"]["performance"] == 72.0
-        assert result["scores"]["seo"] == 95.0
+        result = _normalize(FAKE_LIGHTHOUSE_REPORT, "https://example.com")
+        assert result["scores"][category] == expected
         assert result["url"] == "https://example.com"
 
 
@@ -90,41 +140,138 @@ class TestGitHubController:
         with pytest.raises(ValueError, match="token"):
             GitHubController(token="", repo_owner="test", repo_name="repo")
 
+    def test_commit_files_single_commit(self):
+        """Multiple file changes land as one commit with one ref update."""
+        from site_sentry.github.controller import GitHubController
+
+        gh = GitHubController(token="t", repo_owner="test", repo_name="repo")
+        posts = {}
+
+        def fake_get(path):
+            if path.startswith("/git/trees/"):
+                return {
+                    "tree": [
+                        {"path": "index.html", "mode": "100644", "type": "blob"},
+                        {"path": "build.sh", "mode": "100755", "type": "blob"},
+                    ]
+                }
+            return {"tree": {"sha": "base-tree"}}
+
+        def fake_post(path, payload):
+            posts[path] = payload
+            return {"sha": "tree-sha" if path == "/git/trees" else "commit-sha"}
+
+        with patch.object(gh, "get_default_branch_sha", return_value="head-sha"), \
+                patch.object(gh, "_get", side_effect=fake_get), \
+                patch.object(gh, "_post", side_effect=fake_post), \
+                patch.object(gh, "_patch", return_value={}) as mock_patch:
+            results = gh.commit_files(
+                [
+                    {"path": "index.html", "content": "<html></html>"},
+                    {"path": "build.sh", "content": "#!/bin/sh"},
+                ],
+                branch="sentry/fix-1",
+            )
+
+        assert list(posts) == ["/git/trees", "/git/commits"]
+        modes = {entry["path"]: entry["mode"] for entry in posts["/git/trees"]["tree"]}
+        assert modes == {"index.html": "100644", "build.sh": "100755"}
+        mock_patch.assert_called_once_with("/git/refs/heads/sentry/fix-1", {"sha": "commit-sha"})
+        assert [r["path"] for r in results] == ["index.html", "build.sh"]
+        assert {r["commit_sha"] for r in results} == {"commit-sha"}
+
+    def test_commit_files_reuses_created_branch_head(self):
+        """A branch created by this controller is committed to without re-reading its ref."""
+        from site_sentry.github.controller import GitHubController
+
+        gh = GitHubController(token="t", repo_owner="test", repo_name="repo")
+        commit_payloads = []
+
+        def fake_get(path):
+            if path.startswith("/git/trees/"):
+                return {"tree": []}
+            return {"tree": {"sha": "base-tree"}}
+
+        def fake_post(path, payload):
+            if path == "/git/refs":
+                return {"object": {"sha": "base-sha"}}
+            if path == "/git/commits":
+                commit_payloads.append(payload)
+            return {"sha": "tree-sha" if path == "/git/trees" else "commit-sha"}
+
+        with patch.object(gh, "get_default_branch_sha", return_value="base-sha") as mock_sha, \
+                patch.object(gh, "_get", side_effect=fake_get), \
+                patch.object(gh, "_post", side_effect=fake_post), \
+                patch.object(gh, "_patch", return_value={}):
+            gh.create_branch("sentry/fix-1", base_branch="main")
+            gh.commit_files([{"path": "index.html", "content": ""}], branch="sentry/fix-1")
+
+        mock_sha.assert_called_once_with("main")
+        assert commit_payloads[0]["parents"] == ["base-sha"]
+
+    def test_list_files(self):
+        """Tree listing returns blob paths only, and None when truncated."""
+        from site_sentry.github.controller import GitHubController
+
+        gh = GitHubController(token="t", repo_owner="test", repo_name="repo")
+        tree = [
+            {"path": "src", "type": "tree"},
+            {"path": "src/App.jsx", "type": "blob"},
+            {"path": "index.html", "type": "blob"},
+        ]
+        with patch.object(gh, "_get", return_value={"tree": tree, "truncated": False}):
+            assert gh.list_files("main") == ["src/App.jsx", "index.html"]
+        with patch.object(gh, "_get", return_value={"tree": tree, "truncated": True}):
+            assert gh.list_files("main") is None
+
 
 class TestPipelineInit:
-    def test_pipeline_no_github(self, tmp_path):
+    def test_pipeline_no_github(self, sentry_config, mock_llm):
         """Pipeline should init without GitHub credentials (dry-run mode)."""
-        from site_sentry.config.schema import SentryConfig
         from site_sentry.pipeline import SentryPipeline
 
-        config_path = make_test_config(tmp_path)
-        with patch.dict(os.environ, {"NVIDIA_API_KEY": "nvapi-test"}):
-            config = SentryConfig.load(str(config_path))
-            with patch("site_sentry.core.llm_provider.get_llm") as mock_llm:
-                mock_llm.return_value = MagicMock()
-                pipeline = SentryPipeline(config)
-                assert pipeline.github is None  # No credentials configured
+        pipeline = SentryPipeline(sentry_config)
+        assert pipeline.github is None  # No credentials configured
+        assert pipeline.read_agent.llm is mock_llm
+
+    async def test_cleanup_failures_are_logged(self, sentry_config, mock_llm):
+        """A failing agent cleanup is logged; the rest of cleanup still runs."""
+        from site_sentry.pipeline import SentryPipeline
+
+        pipeline = SentryPipeline(sentry_config)
+        pipeline.read_agent.cleanup = AsyncMock(side_effect=RuntimeError("boom"))
+        pipeline.manager_agent.cleanup = AsyncMock()
+        pipeline.logger = MagicMock()
+
+        await pipeline.cleanup()
+
+        pipeline.manager_agent.cleanup.assert_awaited_once()
+        pipeline.logger.warning.assert_called_once_with(
+            "Agent cleanup failed", agent="read_agent", error="boom"
+        )
+
+    async def test_run_pipeline_cleans_up_when_run_raises(self):
+        """The CLI releases pipeline resources even when run() blows up."""
+        from site_sentry.cli.commands import _run_pipeline
+
+        pipeline = MagicMock()
+        pipeline.run = AsyncMock(side_effect=RuntimeError("audit crashed"))
+        pipeline.cleanup = AsyncMock()
+
+        with pytest.raises(RuntimeError, match="audit crashed"):
+            await _run_pipeline(pipeline, url=None, dry_run=True)
+        pipeline.cleanup.assert_awaited_once()
 
 
 class TestAccessibilityAgent:
-    def test_accessibility_agent_no_issues(self, tmp_path):
+    async def test_accessibility_agent_no_issues(self, sentry_config, mock_llm):
         """Agent returns empty changes when no issues are passed."""
-        import asyncio
-
         from site_sentry.agents.accessibility_agent import AccessibilityAgent
-        from site_sentry.config.schema import SentryConfig
 
-        config_path = make_test_config(tmp_path)
-        with patch.dict(os.environ, {"NVIDIA_API_KEY": "nvapi-test"}):
-            config = SentryConfig.load(str(config_path))
-            with patch("site_sentry.core.llm_provider.get_llm") as mock_llm:
-                mock_llm.return_value = MagicMock()
-                agent = AccessibilityAgent(config)
-                result = asyncio.run(
-                    agent.process({"issues": [], "url": "https://example.com"})
-                )
-                assert result["status"] == "success"
-                assert result["changes"] == []
+        agent = AccessibilityAgent(sentry_config)
+        result = await agent.process({"issues": [], "url": "https://example.com"})
+        assert result["status"] == "success"
+        assert result["changes"] == []
 
     def test_accessibility_agent_in_agents_init(self):
         """AccessibilityAgent is exported from the agents package."""
@@ -141,10 +288,141 @@ class TestAccessibilityAgent:
         assert toggle.accessibility is True
 
     def test_accessibility_wired_in_manager(self):
-        """AccessibilityAgent is registered in ManagerAgent.agents dict."""
-        import inspect
+        """AccessibilityAgent is registered in ManagerAgent.AGENT_CLASSES."""
+        from site_sentry.agents.accessibility_agent import AccessibilityAgent
+        from site_sentry.agents.manager_agent import ManagerAgent
+
+        assert ManagerAgent.AGENT_CLASSES["accessibility"] is AccessibilityAgent
+
+
+# Captured before any test patches asyncio.sleep to record stagger delays
+_REAL_SLEEP = asyncio.sleep
+
+
+class _FakeAgent:
+    """Specialized-agent stand-in that finishes after ``delay`` seconds."""
+
+    def __init__(self, name, delay, finished, error=None):
+        self.name = name
+        self.delay = delay
+        self.finished = finished
+        self.error = error
+
+    async def process(self, agent_input):
+        await _REAL_SLEEP(self.delay)
+        self.finished.append(self.name)
+        if self.error:
+            raise self.error
+        return {
+            "status": "success",
+            "changes": [{"path": f"{self.name}.txt", "content": ""}],
+            "summary": self.name,
+        }
+
 
+class _FakeGitHub:
+    """GitHubController stand-in serving ``files`` and recording reads."""
+
+    def __init__(self, files, listing):
+        self.files = files
+        self.listing = listing
+        self.requested = []
+
+    def list_files(self, branch):
+        if isinstance(self.listing, Exception):
+            raise self.listing
+        return self.listing
+
+    def get_file(self, path, branch):
+        self.requested.append(path)
+        if path not in self.files:
+            return None
+        return {"content": self.files[path], "sha": "sha", "path": path}
+
+
+class _SlowGitHub(_FakeGitHub):
+    """Fake controller whose reads block, tracking peak in-flight requests."""
+
+    def __init__(self, files):
+        super().__init__(files, listing=list(files))
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.peak = 0
+
+    def get_file(self, path, branch):
+        with self._lock:
+            self._in_flight += 1
+            self.peak = max(self.peak, self._in_flight)
+        time.sleep(0.02)
+        with self._lock:
+            self._in_flight -= 1
+        return super().get_file(path, branch)
+
+
+class TestManagerAgent:
+    @pytest.mark.parametrize(
+        "listing, probes_all",
+        [
+            (["index.html", "robots.txt", "README.md"], False),
+            (None, True),  # truncated tree listing
+            (RuntimeError("tree listing failed"), True),
+        ],
+    )
+    async def test_fetch_files_uses_tree_listing(self, sentry_config, mock_llm, listing, probes_all):
+        """Only listed paths are read; without a listing every candidate is probed."""
         from site_sentry.agents.manager_agent import ManagerAgent
 
-        src = inspect.getsource(ManagerAgent.__init__)
-        assert '"accessibility"' in src or "'accessibility'" in src
+        files = {"index.html": "<html></html>", "robots.txt": "User-agent: *"}
+        github = _FakeGitHub(files, listing)
+        manager = ManagerAgent(sentry_config, github=github)
+
+        result = await manager._fetch_files({"active_agents": ["seo"]})
+
+        assert result["file_contents"] == files
+        expected = ManagerAgent.AGENT_FILE_PATTERNS["seo"] if probes_all else files
+        assert sorted(github.requested) == sorted(expected)
+
+    async def test_fetch_files_concurrent_within_limit(self, sentry_config, mock_llm):
+        """File reads overlap in worker threads but never exceed the fetch limit."""
+        from site_sentry.agents.manager_agent import ManagerAgent
+
+        files = {path: path for path in ManagerAgent.AGENT_FILE_PATTERNS["seo"]}
+        github = _SlowGitHub(files)
+        manager = ManagerAgent(sentry_config, github=github)
+        manager.MAX_CONCURRENT_FETCHES = 3
+
+        result = await manager._fetch_files({"active_agents": ["seo"]})
+
+        assert result["file_contents"] == files
+        assert 1 < github.peak <= 3
+
+    async def test_run_agents_staggered_and_ordered(self, sentry_config, mock_llm, monkeypatch):
+        """Agents start on the stagger schedule; results keep priority order."""
+        from site_sentry.agents.manager_agent import ManagerAgent
+
+        manager = ManagerAgent(sentry_config)
+        finished = []
+        manager.agents = {
+            "seo": _FakeAgent("seo", 0.03, finished),
+            "performance": _FakeAgent("performance", 0.01, finished, RuntimeError("boom")),
+            "accessibility": _FakeAgent("accessibility", 0, finished),
+        }
+
+        delays = []
+
+        async def fake_sleep(seconds):
+            delays.append(seconds)
+            await _REAL_SLEEP(0)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        result = await manager._run_agents(
+            {"active_agents": ["seo", "performance", "accessibility"], "url": "https://example.com"}
+        )
+
+        assert delays == [ManagerAgent.AGENT_START_INTERVAL * i for i in (1, 2)]
+        assert finished == ["accessibility", "performance", "seo"]
+        results = result["agent_results"]
+        assert [r["agent"] for r in results] == ["seo", "performance", "accessibility"]
+        assert [r["status"] for r in results] == ["success", "error", "success"]
+        assert results[1]["error"] == "boom"
+        assert results[1]["changes"] == []